@@ -5,26 +5,51 @@ Script pour récupérer et parser les flux RSS automatiquement
 Compatible avec GitHub Actions
 
 Requirements:
-    pip install feedparser requests beautifulsoup4 python-dateutil
+    pip install feedparser requests beautifulsoup4 python-dateutil pyahocorasick selectolax orjson
 
 Usage:
     python scripts/fetch-feeds.py
 """
 
+import ahocorasick
+import bisect
 import feedparser
-import json
+import html
+import orjson
 import os
 import re
+import requests
+import threading
+from calendar import timegm
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone, timedelta
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Set, Tuple
 from urllib.parse import urlparse
 import hashlib
 
+from dateutil import parser as dateutil_parser
+from requests.adapters import HTTPAdapter
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # Repli sur le nettoyage par regex
+    LexborHTMLParser = None
+
 # Configuration
 DATA_DIR = 'data'
 FEEDS_CONFIG = 'feeds/sources.json'
+FEED_STATE_FILE = os.path.join(DATA_DIR, '.feed_state.json')  # ETag / Last-Modified de chaque flux
 MAX_ARTICLES_PER_SOURCE = 10  # Nombre d'articles à récupérer par source à chaque exécution
 MAX_DAYS_OLD = 7  # Supprime les articles de plus de 7 jours
+HTML_PARSER_MIN_LENGTH = 200  # Au-delà, le HTML est confié à un vrai parseur plutôt qu'à la regex
+FETCH_MAX_WORKERS = 8  # Nombre de flux récupérés en parallèle (IO-bound)
+NICHE_MAX_WORKERS = 4  # Nombre de niches traitées en parallèle
+REQUEST_TIMEOUT = 10  # Délai maximum (en secondes) pour récupérer un flux
+
+# Niches traitées ; PHP, Angular et Spring peuvent être des sous-sections de "dev"
+NICHES = ['ai', 'security', 'dev', 'php', 'angular', 'spring', 'finance']
+DEV_SUBSECTION_NICHES = ['php', 'angular', 'spring']
 
 # Mots-clés pour le scoring par niche
 KEYWORDS_SCORING = {
@@ -67,11 +92,124 @@ KEYWORDS_SCORING = {
     }
 }
 
+# Points attribués par mot-clé trouvé selon son niveau
+KEYWORD_TIER_POINTS = {
+    'high': 10,
+    'medium': 3,
+    'low': 1
+}
+
+# Multiplicateur appliqué au score selon la priorité de la source
+PRIORITY_MULTIPLIERS = {
+    'high': 1.2,
+    'medium': 1.0,
+    'low': 0.8
+}
+
+# Paliers de fraîcheur (âge en heures) et points associés
+FRESHNESS_HOURS = (6, 24, 72, 168)  # 168h = 1 semaine
+FRESHNESS_POINTS = (30, 25, 15, 5, 0)
+
+# Paliers de longueur de description (en caractères) et points associés
+CONTENT_LENGTH_THRESHOLDS = (100, 200, 500)
+CONTENT_LENGTH_POINTS = (2, 4, 7, 10)
+
+# Session HTTP partagée : les connexions TCP/TLS sont réutilisées d'un flux à l'autre
+SESSION = requests.Session()
+SESSION.headers.update({
+    'User-Agent': feedparser.USER_AGENT,
+    'Accept': feedparser.http.ACCEPT_HEADER
+})
+SESSION.mount('http://', HTTPAdapter(pool_maxsize=FETCH_MAX_WORKERS * NICHE_MAX_WORKERS))
+SESSION.mount('https://', HTTPAdapter(pool_maxsize=FETCH_MAX_WORKERS * NICHE_MAX_WORKERS))
+
+# Verrou d'affichage : les niches et leurs flux sont traités dans plusieurs threads
+PRINT_LOCK = threading.Lock()
+
+# Parseur de dates interne de feedparser (gère les formats RSS/Atom courants)
+feedparser_parse_date = feedparser.datetimes._parse_date
+
+# Expressions régulières utilisées pour nettoyer le HTML
+HTML_SCRIPT_STYLE_RE = re.compile(r'<(script|style)\b[^>]*>.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+HTML_TAG_RE = re.compile(r'<[^>]+>')
+HTML_BLOCK_TAG_RE = re.compile(
+    r'<(?:br|hr|/?(?:p|div|li|ul|ol|dl|dt|dd|h[1-6]|blockquote|pre|table|tr|td|th'
+    r'|section|article|header|footer|figure|figcaption))\b[^>]*>',
+    re.IGNORECASE
+)
+WHITESPACE_RE = re.compile(r'\s+')
+
+# Sources reconnues pour le score d'autorité
+TRUSTED_SOURCES = (
+    'techcrunch', 'wired', 'thehackernews', 'bleeping', 'ars technica',
+    'mit technology review', 'bloomberg', 'reuters', 'venturebeat',
+    'android', 'google', 'microsoft', 'openai', 'anthropic',
+    'github', 'spring', 'angular', 'react'
+)
+
+
+def build_keyword_automaton(tiers: Dict[str, List[str]]) -> ahocorasick.Automaton:
+    """
+    Compile les mots-clés d'une niche en un automate Aho-Corasick
+    
+    Chaque mot-clé (en minuscules) est associé à ses points (selon son niveau)
+    et à sa forme d'origine, ce qui permet de trouver et scorer tous les
+    mots-clés en un seul passage.
+    """
+    automaton = ahocorasick.Automaton()
+    
+    for tier, keywords in tiers.items():
+        for keyword in keywords:
+            automaton.add_word(keyword.lower(), (KEYWORD_TIER_POINTS[tier], keyword))
+    
+    automaton.make_automaton()
+    return automaton
+
+
+def build_trusted_sources_automaton(trusted_sources: Tuple[str, ...]) -> ahocorasick.Automaton:
+    """Compile les sources reconnues en un automate Aho-Corasick"""
+    automaton = ahocorasick.Automaton()
+    
+    for trusted in trusted_sources:
+        automaton.add_word(trusted, trusted)
+    
+    automaton.make_automaton()
+    return automaton
+
+
+# Automates compilés une seule fois au chargement
+KEYWORDS_AUTOMATA = {niche: build_keyword_automaton(tiers) for niche, tiers in KEYWORDS_SCORING.items()}
+TRUSTED_SOURCES_AUTOMATON = build_trusted_sources_automaton(TRUSTED_SOURCES)
+
+
+def log(message: str, log_lines: Optional[List[str]] = None) -> None:
+    """
+    Affiche un message, ou l'ajoute au journal d'une niche
+    
+    Les niches étant traitées en parallèle, leurs messages sont regroupés dans
+    log_lines puis affichés d'un bloc quand la niche est terminée.
+    
+    Args:
+        message: Message à afficher
+        log_lines: Journal de la niche en cours (affichage immédiat si absent)
+    """
+    if log_lines is not None:
+        log_lines.append(message)
+    else:
+        with PRINT_LOCK:
+            print(message)
+
 
 def generate_article_id(title: str, url: str) -> str:
-    """Génère un ID unique pour un article basé sur son titre et URL"""
+    """
+    Génère un ID unique pour un article basé sur son titre et URL
+    
+    MD5 sert uniquement d'identifiant de déduplication (pas d'usage cryptographique).
+    L'algorithme ne doit pas changer : les IDs sont persistés dans data/ et
+    dans les favoris des utilisateurs (localStorage).
+    """
     unique_string = f"{title}_{url}"
-    return hashlib.md5(unique_string.encode()).hexdigest()[:16]
+    return hashlib.md5(unique_string.encode(), usedforsecurity=False).hexdigest()[:16]
 
 
 def clean_html(text: str) -> str:
@@ -79,55 +217,66 @@ def clean_html(text: str) -> str:
     if not text:
         return ""
     
-    # Supprime les balises HTML
-    clean = re.compile('<.*?>')
-    text = re.sub(clean, '', text)
+    # Sépare les blocs (paragraphes, listes, <br>...) par un espace ; les balises
+    # en ligne (<a>, <strong>...) n'en ajoutent pas, la ponctuation reste collée
+    text = HTML_BLOCK_TAG_RE.sub(r' \g<0>', text)
     
-    # Supprime les espaces multiples
-    text = re.sub(r'\s+', ' ', text)
+    if LexborHTMLParser and len(text) > HTML_PARSER_MIN_LENGTH and '<' in text and '>' in text:
+        # Vrai HTML (balises imbriquées ou mal fermées) : parseur C, qui décode aussi les entités
+        tree = LexborHTMLParser(text)
+        tree.strip_tags(['script', 'style'])
+        text = tree.text(separator='')
+    else:
+        # Supprime les scripts/styles puis les balises HTML
+        text = HTML_SCRIPT_STYLE_RE.sub('', text)
+        text = HTML_TAG_RE.sub('', text)
+        
+        # Décode les entités HTML (avant de réduire les espaces pour que &nbsp; en soit un)
+        text = html.unescape(text)
     
-    # Décode les entités HTML
-    text = text.replace('&nbsp;', ' ')
-    text = text.replace('&amp;', '&')
-    text = text.replace('&lt;', '<')
-    text = text.replace('&gt;', '>')
-    text = text.replace('&quot;', '"')
-    text = text.replace('&#39;', "'")
+    # Supprime les espaces multiples
+    text = WHITESPACE_RE.sub(' ', text)
     
     return text.strip()
 
 
 def parse_date(date_string: str) -> str:
     """Parse une date et retourne au format ISO"""
+    if not date_string:
+        return datetime.now(timezone.utc).isoformat()
+    
+    return parse_date_string(date_string)
+
+
+@lru_cache(maxsize=8192)
+def parse_date_string(date_string: str) -> str:
+    """
+    Parse une date non vide et retourne au format ISO
+    
+    Mis en cache : les mêmes dates reviennent d'une niche et d'une source à l'autre.
+    """
     try:
-        if not date_string:
-            return datetime.now(timezone.utc).isoformat()
-        
-        # feedparser retourne déjà un tuple de temps
-        from time import mktime
-        from dateutil import parser
-        
         try:
-            # Essaie de parser avec feedparser
-            parsed = feedparser._parse_date(date_string)
+            # Essaie de parser avec feedparser (tuple de temps déjà en UTC)
+            parsed = feedparser_parse_date(date_string)
             if parsed:
-                dt = datetime.fromtimestamp(mktime(parsed), tz=timezone.utc)
+                dt = datetime.fromtimestamp(timegm(parsed), tz=timezone.utc)
                 return dt.isoformat()
         except:
             pass
         
         # Essaie avec dateutil
-        dt = parser.parse(date_string)
+        dt = dateutil_parser.parse(date_string)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
         return dt.isoformat()
         
     except Exception as e:
-        print(f"Error parsing date '{date_string}': {e}")
+        log(f"Error parsing date '{date_string}': {e}")
         return datetime.now(timezone.utc).isoformat()
 
 
-def calculate_relevance_score(article: Dict, niche: str) -> int:
+def calculate_relevance_score(article: Dict, niche: str, now: Optional[datetime] = None) -> Tuple[int, Set[str]]:
     """
     Calcule un score de pertinence de 0 à 100
     
@@ -136,98 +285,88 @@ def calculate_relevance_score(article: Dict, niche: str) -> int:
     - Fraîcheur (30 points)
     - Autorité de la source (20 points)
     - Longueur/qualité du contenu (10 points)
+    
+    Args:
+        article: Article à scorer
+        niche: Niche de l'article
+        now: Date de référence pour la fraîcheur (maintenant par défaut),
+             à calculer une fois pour tout un lot d'articles
+    
+    Returns:
+        Le score et les mots-clés de la niche trouvés dans l'article
     """
     score = 0
+    keywords = set()
     
     title = article.get('title', '').lower()
     description = article.get('description', '').lower()
     content = f"{title} {description}"
     
     # 1. Mots-clés (40 points max)
-    keywords = KEYWORDS_SCORING.get(niche, {})
-    
-    for keyword in keywords.get('high', []):
-        if keyword.lower() in content:
-            score += 10
+    automaton = KEYWORDS_AUTOMATA.get(niche)
     
-    for keyword in keywords.get('medium', []):
-        if keyword.lower() in content:
-            score += 3
-    
-    for keyword in keywords.get('low', []):
-        if keyword.lower() in content:
-            score += 1
+    if automaton is not None:
+        # Un mot-clé présent plusieurs fois ne compte qu'une fois
+        matches = {match for _, match in automaton.iter(content)}
+        score += sum(points for points, _ in matches)
+        keywords = {keyword for _, keyword in matches}
     
     score = min(score, 40)  # Cap à 40 points
     
     # 2. Fraîcheur (30 points max)
+    if now is None:
+        now = datetime.now(timezone.utc)
+    
     try:
         published_date = datetime.fromisoformat(article.get('published', ''))
-        now = datetime.now(timezone.utc)
         hours_old = (now - published_date).total_seconds() / 3600
         
-        if hours_old < 6:
-            score += 30
-        elif hours_old < 24:
-            score += 25
-        elif hours_old < 72:
-            score += 15
-        elif hours_old < 168:  # 1 semaine
-            score += 5
+        score += FRESHNESS_POINTS[bisect.bisect_right(FRESHNESS_HOURS, hours_old)]
     except:
         score += 10  # Score par défaut si erreur de date
     
     # 3. Autorité de la source (20 points max)
-    trusted_sources = [
-        'techcrunch', 'wired', 'thehackernews', 'bleeping', 'ars technica',
-        'mit technology review', 'bloomberg', 'reuters', 'venturebeat',
-        'android', 'google', 'microsoft', 'openai', 'anthropic',
-        'github', 'spring', 'angular', 'react'
-    ]
-    
-    source = article.get('source', '').lower()
-    url = article.get('url', '').lower()
+    # Un seul passage sur le nom de la source et l'URL (séparés pour éviter
+    # une correspondance à cheval sur les deux)
+    source_and_url = f"{article.get('source', '')}\n{article.get('url', '')}".lower()
     
-    for trusted in trusted_sources:
-        if trusted in source or trusted in url:
-            score += 20
-            break
+    if next(TRUSTED_SOURCES_AUTOMATON.iter(source_and_url), None):
+        score += 20
     else:
         score += 5  # Source inconnue mais existante
     
     # 4. Qualité du contenu (10 points max)
     content_length = len(description)
     
-    if content_length > 500:
-        score += 10
-    elif content_length > 200:
-        score += 7
-    elif content_length > 100:
-        score += 4
-    else:
-        score += 2
+    score += CONTENT_LENGTH_POINTS[bisect.bisect_left(CONTENT_LENGTH_THRESHOLDS, content_length)]
     
-    return min(score, 100)
+    return min(score, 100), keywords
 
 
-def extract_keywords(article: Dict, niche: str) -> List[str]:
-    """Extrait les mots-clés pertinents d'un article"""
-    keywords = []
-    content = f"{article.get('title', '')} {article.get('description', '')}".lower()
-    
-    # Utilise les mots-clés définis pour cette niche
-    all_keywords = KEYWORDS_SCORING.get(niche, {})
+def score_article(article: Dict, niche: str, priority: str, now: datetime) -> None:
+    """
+    Score un article et extrait ses mots-clés (modifie l'article en place)
     
-    for priority in ['high', 'medium', 'low']:
-        for keyword in all_keywords.get(priority, []):
-            if keyword.lower() in content:
-                keywords.append(keyword)
+    Args:
+        article: Article à scorer
+        niche: Niche de l'article
+        priority: Priorité de la source (high, medium, low)
+        now: Date de référence pour la fraîcheur
+    """
+    score, keywords = calculate_relevance_score(article, niche, now)
     
     # Limite à 5 mots-clés
-    return list(set(keywords))[:5]
+    article['keywords'] = list(keywords)[:5]
+    article['score'] = min(int(score * PRIORITY_MULTIPLIERS.get(priority, 1.0)), 100)
 
 
-def fetch_feed(feed_url: str, niche: str, source_name: str = None) -> List[Dict]:
+def fetch_feed(
+    feed_url: str,
+    niche: str,
+    source_name: str = None,
+    feed_state: Optional[Dict] = None,
+    log_lines: Optional[List[str]] = None
+) -> List[Dict]:
     """
     Récupère et parse un flux RSS
     
@@ -235,18 +374,52 @@ def fetch_feed(feed_url: str, niche: str, source_name: str = None) -> List[Dict]
         feed_url: URL du flux RSS
         niche: Niche de l'article (ai, security, dev, finance)
         source_name: Nom personnalisé de la source (optionnel)
+        feed_state: ETag / Last-Modified par URL pour cette niche (optionnel),
+                    mis à jour après chaque récupération réussie (les IDs des
+                    articles couverts sont ajoutés par process_niche après la fusion)
+        log_lines: Journal de la niche (optionnel)
     
     Returns:
-        Liste des articles parsés
+        Liste des articles parsés (vide si le flux n'a pas changé)
     """
-    print(f"  📡 Fetching {feed_url}...")
+    log(f"  📡 Fetching {feed_url}...", log_lines)
     
     try:
-        # Parse le feed
-        feed = feedparser.parse(feed_url)
+        # Requête conditionnelle si le flux a déjà été récupéré
+        validators = feed_state.get(feed_url, {}) if feed_state is not None else {}
+        request_headers = {}
+        
+        if validators.get('etag'):
+            request_headers['If-None-Match'] = validators['etag']
+        if validators.get('modified'):
+            request_headers['If-Modified-Since'] = validators['modified']
+        
+        # Récupère le flux via la session partagée
+        response = SESSION.get(feed_url, headers=request_headers, timeout=REQUEST_TIMEOUT)
+        
+        # Flux inchangé : process_niche n'envoie les validateurs que si tous ses
+        # articles sont encore dans le fichier de la niche
+        if response.status_code == 304:
+            log(f"  💤 Not modified: {feed_url}", log_lines)
+            return []
+        
+        response.raise_for_status()
+        
+        # feedparser attend des en-têtes en minuscules (encodage, URL de base)
+        response_headers = {key.lower(): value for key, value in response.headers.items()}
+        response_headers['content-location'] = response.url
+        
+        # Parse le feed (sans sanitisation ni résolution des liens : clean_html
+        # retire de toute façon le HTML, y compris des entrées ignorées ensuite)
+        feed = feedparser.parse(
+            response.content,
+            response_headers=response_headers,
+            sanitize_html=False,
+            resolve_relative_uris=False
+        )
         
         if feed.bozo:
-            print(f"  ⚠️  Warning: Feed may have issues - {feed.bozo_exception}")
+            log(f"  ⚠️  Warning: Feed may have issues - {feed.bozo_exception}", log_lines)
         
         articles = []
         
@@ -284,23 +457,36 @@ def fetch_feed(feed_url: str, niche: str, source_name: str = None) -> List[Dict]
                 articles.append(article)
                 
             except Exception as e:
-                print(f"  ❌ Error parsing entry: {e}")
+                log(f"  ❌ Error parsing entry: {e}", log_lines)
                 continue
         
-        print(f"  ✅ Fetched {len(articles)} articles")
+        # Mémorise les validateurs pour la prochaine exécution
+        if feed_state is not None:
+            validators = {
+                'etag': response.headers.get('ETag'),
+                'modified': response.headers.get('Last-Modified')
+            }
+            
+            if any(validators.values()):
+                feed_state[feed_url] = {key: value for key, value in validators.items() if value}
+            else:
+                feed_state.pop(feed_url, None)
+        
+        log(f"  ✅ Fetched {len(articles)} articles from {source_name}", log_lines)
         return articles
         
     except Exception as e:
-        print(f"  ❌ Error fetching {feed_url}: {e}")
+        log(f"  ❌ Error fetching {feed_url}: {e}", log_lines)
         return []
 
 
-def load_existing_articles(output_file: str) -> List[Dict]:
+def load_existing_articles(output_file: str, log_lines: Optional[List[str]] = None) -> List[Dict]:
     """
     Charge les articles existants depuis le fichier JSON
     
     Args:
         output_file: Chemin du fichier JSON
+        log_lines: Journal de la niche (optionnel)
     
     Returns:
         Liste des articles existants (vide si le fichier n'existe pas)
@@ -309,21 +495,55 @@ def load_existing_articles(output_file: str) -> List[Dict]:
         return []
     
     try:
-        with open(output_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(output_file, 'rb') as f:
+            data = orjson.loads(f.read())
             return data.get('articles', [])
     except Exception as e:
-        print(f"  ⚠️  Error loading existing articles: {e}")
+        log(f"  ⚠️  Error loading existing articles: {e}", log_lines)
         return []
 
 
-def remove_old_articles(articles: List[Dict], max_days: int = MAX_DAYS_OLD) -> List[Dict]:
+def load_feed_state() -> Dict[str, Dict]:
+    """
+    Charge les ETag / Last-Modified enregistrés lors de la dernière exécution
+    
+    Returns:
+        Dictionnaire niche -> {url: validateurs et IDs} (vide si le fichier n'existe pas)
+    """
+    if not os.path.exists(FEED_STATE_FILE):
+        return {}
+    
+    try:
+        with open(FEED_STATE_FILE, 'rb') as f:
+            return orjson.loads(f.read())
+    except Exception as e:
+        print(f"⚠️  Error loading feed state: {e}")
+        return {}
+
+
+def save_feed_state(feed_state: Dict[str, Dict]) -> None:
+    """
+    Enregistre les ETag / Last-Modified pour la prochaine exécution
+    
+    Args:
+        feed_state: Dictionnaire niche -> {url: validateurs et IDs}
+    """
+    with open(FEED_STATE_FILE, 'wb') as f:
+        f.write(orjson.dumps(feed_state, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS))
+
+
+def remove_old_articles(
+    articles: List[Dict],
+    max_days: int = MAX_DAYS_OLD,
+    log_lines: Optional[List[str]] = None
+) -> List[Dict]:
     """
     Supprime les articles plus vieux que max_days jours
     
     Args:
         articles: Liste des articles
         max_days: Nombre maximum de jours
+        log_lines: Journal de la niche (optionnel)
     
     Returns:
         Liste filtrée des articles récents
@@ -342,18 +562,27 @@ def remove_old_articles(articles: List[Dict], max_days: int = MAX_DAYS_OLD) -> L
     
     removed_count = len(articles) - len(recent_articles)
     if removed_count > 0:
-        print(f"  🗑️  Removed {removed_count} old articles (>{max_days} days)")
+        log(f"  🗑️  Removed {removed_count} old articles (>{max_days} days)", log_lines)
     
     return recent_articles
 
 
-def merge_articles(existing: List[Dict], new: List[Dict]) -> List[Dict]:
+def merge_articles(existing: List[Dict], new: List[Dict], log_lines: Optional[List[str]] = None) -> List[Dict]:
     """
     Fusionne les articles existants et nouveaux, évite les doublons
     
+    Un nouvel article dont l'URL correspond à un article existant reprend l'ID
+    de celui-ci : les titres contenant des entités doublement échappées
+    (&#039;, &#x3f;...) ne donnent plus le même ID depuis html.unescape, et
+    l'ID stocké est aussi celui des favoris. Cela fusionne toute paire
+    existant/nouveau de même URL, y compris un article republié avec un titre
+    modifié : le nouveau titre n'est retenu que si son score est meilleur.
+    L'ID de l'article nouveau est réécrit en place.
+    
     Args:
         existing: Articles existants
         new: Nouveaux articles
+        log_lines: Journal de la niche (optionnel)
     
     Returns:
         Liste fusionnée sans doublons
@@ -362,8 +591,13 @@ def merge_articles(existing: List[Dict], new: List[Dict]) -> List[Dict]:
     articles_dict = {}
     
     # Ajoute d'abord les articles existants
+    ids_by_url = {}
+    
     for article in existing:
         articles_dict[article['id']] = article
+        
+        if article.get('url'):
+            ids_by_url[article['url']] = article['id']
     
     # Ajoute/met à jour avec les nouveaux articles
     new_count = 0
@@ -371,6 +605,12 @@ def merge_articles(existing: List[Dict], new: List[Dict]) -> List[Dict]:
     
     for article in new:
         article_id = article['id']
+        
+        # Même URL qu'un article existant : conserve l'ID déjà publié
+        if article_id not in articles_dict and article.get('url') in ids_by_url:
+            article_id = ids_by_url[article['url']]
+            article['id'] = article_id
+        
         if article_id in articles_dict:
             # Article existe déjà, on met à jour le score s'il est meilleur
             if article['score'] > articles_dict[article_id]['score']:
@@ -381,13 +621,19 @@ def merge_articles(existing: List[Dict], new: List[Dict]) -> List[Dict]:
             articles_dict[article_id] = article
             new_count += 1
     
-    print(f"  ➕ Added {new_count} new articles")
-    print(f"  🔄 Updated {updated_count} existing articles")
+    log(f"  ➕ Added {new_count} new articles", log_lines)
+    log(f"  🔄 Updated {updated_count} existing articles", log_lines)
     
     return list(articles_dict.values())
 
 
-def process_niche(niche: str, sources: List[Dict], output_file: str) -> List[Dict]:
+def process_niche(
+    niche: str,
+    sources: List[Dict],
+    output_file: str,
+    feed_state: Optional[Dict] = None,
+    log_lines: Optional[List[str]] = None
+) -> List[Dict]:
     """
     Traite tous les flux RSS d'une niche
     
@@ -395,69 +641,161 @@ def process_niche(niche: str, sources: List[Dict], output_file: str) -> List[Dic
         niche: Nom de la niche
         sources: Liste des sources RSS
         output_file: Chemin du fichier de sortie
+        feed_state: ETag / Last-Modified de toutes les niches (optionnel)
+        log_lines: Journal de la niche (optionnel)
     
     Returns:
         Liste des articles agrégés et scorés
     """
-    print(f"\n🔄 Processing niche: {niche.upper()}")
-    print(f"   Sources: {len(sources)}")
+    log(f"\n🔄 Processing niche: {niche.upper()}", log_lines)
+    log(f"   Sources: {len(sources)}", log_lines)
     
     # Charge les articles existants
-    existing_articles = load_existing_articles(output_file)
-    print(f"  📂 Loaded {len(existing_articles)} existing articles")
+    existing_articles = load_existing_articles(output_file, log_lines)
+    log(f"  📂 Loaded {len(existing_articles)} existing articles", log_lines)
     
     # Supprime les vieux articles
-    existing_articles = remove_old_articles(existing_articles)
-    print(f"  📦 Kept {len(existing_articles)} recent articles")
+    existing_articles = remove_old_articles(existing_articles, log_lines=log_lines)
+    log(f"  📦 Kept {len(existing_articles)} recent articles", log_lines)
     
-    new_articles = []
+    # Les articles déjà présents ont été scorés lors d'une exécution précédente
+    known_ids = {article['id'] for article in existing_articles}
+    skipped_count = 0
     
-    # Récupère les articles de chaque source
-    for source in sources:
-        feed_url = source.get('url')
-        source_name = source.get('name')
-        priority = source.get('priority', 'medium')
-        
-        if not feed_url:
-            continue
-        
-        articles = fetch_feed(feed_url, niche, source_name)
-        
-        # Ajuste le score selon la priorité de la source
-        priority_multipliers = {
-            'high': 1.2,
-            'medium': 1.0,
-            'low': 0.8
-        }
+    now = datetime.now(timezone.utc)
+    
+    # Validateurs HTTP propres à la niche : un même flux peut alimenter plusieurs niches.
+    # Un 304 ne renvoie aucun article : si certains articles d'un flux ont été supprimés
+    # (nettoyage des 7 jours, fichier absent), on le récupère en entier pour les réintégrer.
+    niche_feed_state = None
+    
+    if feed_state is not None:
+        niche_feed_state = feed_state.setdefault(niche, {})
         
-        for article in articles:
-            article['source_priority'] = priority
-            new_articles.append(article)
+        for feed_url, validators in list(niche_feed_state.items()):
+            if 'ids' not in validators or not known_ids.issuperset(validators['ids']):
+                del niche_feed_state[feed_url]
     
-    print(f"\n📊 Processing {len(new_articles)} new articles for {niche}...")
+    new_articles = []
+    fetched_feeds = []
     
-    # Calcule les scores et extrait les mots-clés
-    for article in new_articles:
-        article['score'] = calculate_relevance_score(article, niche)
-        article['keywords'] = extract_keywords(article, niche)
+    # Récupère les articles de chaque source en parallèle (les requêtes HTTP dominent)
+    sources = [source for source in sources if source.get('url')]
+    
+    with ThreadPoolExecutor(max_workers=FETCH_MAX_WORKERS) as executor:
+        futures = [
+            (executor.submit(fetch_feed, source['url'], niche, source.get('name'), niche_feed_state, log_lines), source)
+            for source in sources
+        ]
         
-        # Applique le multiplicateur de priorité
-        priority = article.pop('source_priority', 'medium')
-        multiplier = {'high': 1.2, 'medium': 1.0, 'low': 0.8}.get(priority, 1.0)
-        article['score'] = min(int(article['score'] * multiplier), 100)
+        # Parcourt les résultats dans l'ordre des sources pour garder une sortie déterministe
+        for future, source in futures:
+            priority = source.get('priority', 'medium')
+            feed_articles = future.result()
+            fetched_feeds.append((source['url'], feed_articles))
+            
+            # Score chaque nouvel article dès sa réception (un seul passage)
+            for article in feed_articles:
+                if article['id'] in known_ids:
+                    skipped_count += 1
+                    continue
+                
+                score_article(article, niche, priority, now)
+                new_articles.append(article)
+    
+    if skipped_count > 0:
+        log(f"  ⏭️  Skipped {skipped_count} already known articles", log_lines)
+    
+    log(f"\n📊 Scored {len(new_articles)} new articles for {niche}", log_lines)
     
     # Fusionne avec les articles existants
-    all_articles = merge_articles(existing_articles, new_articles)
+    all_articles = merge_articles(existing_articles, new_articles, log_lines)
+    
+    # Associe à chaque flux récupéré (validateurs sans IDs : un 304 garde les siens) les IDs
+    # de ses articles, relevés après la fusion qui peut leur redonner l'ID déjà stocké
+    if niche_feed_state is not None:
+        for feed_url, feed_articles in fetched_feeds:
+            validators = niche_feed_state.get(feed_url)
+            
+            if validators is not None and 'ids' not in validators:
+                validators['ids'] = [article['id'] for article in feed_articles]
     
     # Trie par score décroissant
     all_articles.sort(key=lambda x: x['score'], reverse=True)
     
     # Pas de limite d'articles - accumulation jusqu'au nettoyage des 7 jours
-    print(f"✅ Total: {len(all_articles)} articles (max score: {all_articles[0]['score'] if all_articles else 0})")
+    log(f"✅ Total: {len(all_articles)} articles (max score: {all_articles[0]['score'] if all_articles else 0})", log_lines)
     
     return all_articles
 
 
+def process_and_write_niche(
+    niche: str,
+    sources: List[Dict],
+    feed_state: Optional[Dict] = None,
+    log_lines: Optional[List[str]] = None
+) -> None:
+    """
+    Traite une niche et écrit son fichier JSON
+    
+    Args:
+        niche: Nom de la niche
+        sources: Liste des sources RSS
+        feed_state: ETag / Last-Modified de toutes les niches (optionnel)
+        log_lines: Journal de la niche, rempli même si le traitement échoue (optionnel)
+    """
+    # Prépare le fichier de sortie
+    output_file = os.path.join(DATA_DIR, f'{niche}_news.json')
+    
+    # Traite la niche (avec fusion des articles existants)
+    articles = process_niche(niche, sources, output_file, feed_state, log_lines)
+    
+    # Crée le fichier JSON de sortie
+    output = {
+        'last_updated': datetime.now(timezone.utc).isoformat(),
+        'total_articles': len(articles),
+        'articles': articles
+    }
+    
+    # orjson écrit directement de l'UTF-8 (équivalent à ensure_ascii=False, indent=2)
+    with open(output_file, 'wb') as f:
+        f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    
+    log(f"💾 Saved to {output_file}\n", log_lines)
+
+
+def resolve_sources(config: Dict) -> Dict[str, List[Dict]]:
+    """
+    Associe chaque niche à sa liste de sources RSS
+    
+    Args:
+        config: Configuration chargée depuis sources.json
+    
+    Returns:
+        Dictionnaire niche -> liste des sources (sous-sections aplaties)
+    """
+    resolved = {}
+    dev_subsections = config.get('dev', {}).get('subsections', {})
+    
+    for niche in NICHES:
+        niche_data = config.get(niche, {})
+        
+        # Cas spéciaux : PHP, Angular, Spring sont dans la section "dev"
+        if niche in DEV_SUBSECTION_NICHES and not niche_data:
+            resolved[niche] = dev_subsections.get(niche, [])
+        # Gère les sous-sections (comme pour 'dev' et 'security')
+        elif 'subsections' in niche_data:
+            resolved[niche] = [
+                source
+                for subsection_sources in niche_data['subsections'].values()
+                for source in subsection_sources
+            ]
+        else:
+            resolved[niche] = niche_data.get('sources', [])
+    
+    return resolved
+
+
 def main():
     """Fonction principale"""
     print("=" * 60)
@@ -469,60 +807,51 @@ def main():
     
     # Charge la configuration des sources
     try:
-        with open(FEEDS_CONFIG, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        with open(FEEDS_CONFIG, 'rb') as f:
+            config = orjson.loads(f.read())
     except FileNotFoundError:
         print(f"❌ Error: {FEEDS_CONFIG} not found")
         return
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         print(f"❌ Error parsing {FEEDS_CONFIG}: {e}")
         return
     
-    # Traite chaque niche
-    niches = ['ai', 'security', 'dev', 'php', 'angular', 'spring', 'finance']
+    # Résout une seule fois les sources de chaque niche
+    niche_sources = resolve_sources(config)
     
-    for niche in niches:
-        # Récupère les sources pour cette niche
-        niche_data = config.get(niche, {})
-        
-        # Cas spéciaux : PHP, Angular, Spring sont dans la section "dev"
-        if niche in ['php', 'angular', 'spring'] and not niche_data:
-            dev_data = config.get('dev', {})
-            if 'subsections' in dev_data:
-                # Cherche la sous-section correspondante
-                subsection_name = niche if niche != 'spring' else 'spring'
-                sources = dev_data['subsections'].get(subsection_name, [])
-            else:
-                sources = []
-        # Gère les sous-sections (comme pour 'dev' et 'security')
-        elif 'subsections' in niche_data:
-            sources = []
-            for subsection_sources in niche_data['subsections'].values():
-                sources.extend(subsection_sources)
-        else:
-            sources = niche_data.get('sources', [])
-        
-        if not sources:
-            print(f"⚠️  No sources found for {niche}")
-            continue
-        
-        # Prépare le fichier de sortie
-        output_file = os.path.join(DATA_DIR, f'{niche}_news.json')
-        
-        # Traite la niche (avec fusion des articles existants)
-        articles = process_niche(niche, sources, output_file)
-        
-        # Crée le fichier JSON de sortie
-        output = {
-            'last_updated': datetime.now(timezone.utc).isoformat(),
-            'total_articles': len(articles),
-            'articles': articles
-        }
+    # Charge les validateurs HTTP de la dernière exécution
+    feed_state = load_feed_state()
+    
+    # Traite les niches en parallèle (indépendantes : chacune écrit son propre fichier)
+    first_error = None
+    
+    with ThreadPoolExecutor(max_workers=NICHE_MAX_WORKERS) as executor:
+        futures = {}
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(output, f, ensure_ascii=False, indent=2)
+        for niche in NICHES:
+            sources = niche_sources.get(niche, [])
+            
+            if not sources:
+                log(f"⚠️  No sources found for {niche}")
+                continue
+            
+            log_lines = []
+            futures[executor.submit(process_and_write_niche, niche, sources, feed_state, log_lines)] = log_lines
         
-        print(f"💾 Saved to {output_file}\n")
+        # Affiche le journal de chaque niche dès qu'elle est terminée, y compris
+        # celles qui échouent : ce sont les seuls diagnostics du workflow
+        for future in as_completed(futures):
+            log('\n'.join(futures[future]))
+            
+            if future.exception() is not None and first_error is None:
+                first_error = future.exception()
+    
+    # Propage la première erreur avant d'enregistrer l'état des flux
+    if first_error is not None:
+        raise first_error
+    
+    # Enregistré en dernier : un flux n'est marqué comme vu qu'une fois ses articles sauvegardés
+    save_feed_state(feed_state)
     
     print("=" * 60)
     print("✨ Done! All feeds updated successfully")